@@ -0,0 +1,221 @@
+"""OCR 전처리 방식별 지연 시간 / 감지 재현율(recall) 벤치마크
+
+사용법 (프로젝트 루트에서):
+    python -m benchmarks.preprocess_benchmark                  # 합성 이미지, 전처리 시간만 측정
+    python -m benchmarks.preprocess_benchmark --ocr            # 합성 이미지 + OCR 재현율
+    python -m benchmarks.preprocess_benchmark --proxy          # OCR 모델 없이 윤곽선 기반 대리 재현율
+    python -m benchmarks.preprocess_benchmark a.jpg b.jpg --ocr --reference nlm
+
+합성 이미지는 텍스트 위치(정답)를 알고 있으므로 정답 대비 재현율을,
+실제 이미지는 --reference 방식의 감지 결과 대비 재현율을 계산한다.
+합성 노이즈는 그레이스케일로 더하므로 이미지 이름의 sigma가 곧 noise_threshold와
+비교되는 추정값(noise 열)과 같은 스케일이다.
+"""
+import argparse
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from utils.image_utils import DENOISE_METHODS, enhance_image_for_ocr, estimate_noise
+
+Box = Tuple[int, int, int, int]
+
+SAMPLE_WORDS = ['Image', 'Translator', 'SALE', 'Open 24h', 'Hello World', 'Coffee', 'Menu 2024', 'Exit']
+
+
+def make_synthetic_image(width: int, height: int, noise_sigma: float, font_scale: float = 1.6,
+                         seed: int = 0) -> Tuple[np.ndarray, List[Box]]:
+    """텍스트가 격자로 배치된 합성 이미지와 정답 bbox 생성"""
+    rng = np.random.default_rng(seed)
+    image = np.full((height, width, 3), 235, dtype=np.uint8)
+    boxes = []
+
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    scale, thickness = font_scale, max(1, round(font_scale * 2))
+    rows, cols = max(1, int(height / (60 * font_scale))), 3
+    for row in range(rows):
+        for col in range(cols):
+            text = SAMPLE_WORDS[(row * cols + col) % len(SAMPLE_WORDS)]
+            (text_w, text_h), baseline = cv2.getTextSize(text, font, scale, thickness)
+            x = int((col + 0.1) * width / cols)
+            y = int((row + 0.6) * height / rows)
+            cv2.putText(image, text, (x, y), font, scale, (20, 20, 20), thickness, cv2.LINE_AA)
+            boxes.append((x, y - text_h, text_w, text_h + baseline))
+
+    if noise_sigma > 0:
+        # 모든 채널에 같은 노이즈를 더해 그레이스케일 변환 후에도 sigma가 유지되도록 함
+        noise = rng.normal(0, noise_sigma, image.shape[:2])[:, :, np.newaxis]
+        image = np.clip(image.astype(np.float32) + noise, 0, 255).astype(np.uint8)
+
+    return image, boxes
+
+
+def box_iou(a: Box, b: Box) -> float:
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    inter_w = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    inter_h = max(0, min(ay + ah, by + bh) - max(ay, by))
+    inter = inter_w * inter_h
+    union = aw * ah + bw * bh - inter
+    return inter / union if union > 0 else 0.0
+
+
+def recall(reference: List[Box], detected: List[Box], iou_threshold: float = 0.3) -> float:
+    """reference 박스 중 detected 박스와 IoU가 임계값 이상인 비율
+
+    OCR 엔진이 단어를 합치거나 나누는 경우가 있어 임계값은 느슨하게 둔다.
+    """
+    if not reference:
+        return 1.0
+    matched = sum(1 for ref in reference if any(box_iou(ref, det) >= iou_threshold for det in detected))
+    return matched / len(reference)
+
+
+def proxy_detect(gray: np.ndarray) -> List[Box]:
+    """OCR 모델 없이 Otsu 이진화 + 윤곽선으로 단어 영역을 찾는 대리 감지기
+
+    노이즈가 텍스트와 배경 분리를 무너뜨리는지 확인하는 용도이며 실제 OCR 재현율을 대체하지는 않는다.
+    """
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
+    binary = cv2.dilate(binary, cv2.getStructuringElement(cv2.MORPH_RECT, (9, 3)))
+    contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    boxes = [cv2.boundingRect(contour) for contour in contours]
+    return [box for box in boxes if box[2] >= 6 and box[3] >= 6]
+
+
+def time_preprocess(image: np.ndarray, denoise: str, repeat: int) -> Tuple[float, np.ndarray]:
+    """전처리 평균 소요 시간(ms)과 결과 이미지"""
+    result = None
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = enhance_image_for_ocr(image, denoise=denoise)
+    return (time.perf_counter() - start) * 1000 / repeat, result
+
+
+def detect_boxes(detector, image: Optional[np.ndarray], image_path: str) -> Tuple[float, List[Box]]:
+    """OCR 감지 소요 시간(ms)과 bbox 목록 (image가 None이면 원본 경로로 감지)"""
+    path = image_path
+    if image is not None:
+        fd, path = tempfile.mkstemp(suffix='.png')
+        os.close(fd)
+        cv2.imwrite(path, image)
+
+    try:
+        start = time.perf_counter()
+        blocks = detector.detect_text(path, preprocess=False)
+        elapsed = (time.perf_counter() - start) * 1000
+    finally:
+        if path != image_path:
+            os.remove(path)
+
+    return elapsed, [(b.x, b.y, b.width, b.height) for b in blocks]
+
+
+def run(images: Dict[str, Tuple[str, np.ndarray, Optional[List[Box]]]],
+        methods: List[str], repeat: int, detection: Optional[str], reference: str, engine: str):
+    detector = None
+    if detection == 'ocr':
+        from core.ocr_detector import OCRDetector
+        detector = OCRDetector(lang='multilingual', engine=engine)
+
+    header = f"{'image':<24} {'noise':>6} {'method':<9} {'prep ms':>9}"
+    if detection:
+        header += f" {'det ms':>9} {'total ms':>9} {'blocks':>6} {'recall':>7}"
+    print(header)
+    print('-' * len(header))
+
+    for name, (path, image, truth) in images.items():
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        sigma = estimate_noise(gray)
+
+        rows = []
+        for method in methods:
+            if method == 'off':
+                prep_ms, processed = 0.0, None
+            else:
+                prep_ms, processed = time_preprocess(image, method, repeat)
+
+            row = {'method': method, 'prep_ms': prep_ms}
+            if detector is not None:
+                ocr_ms, boxes = detect_boxes(detector, processed, path)
+                row.update(ocr_ms=ocr_ms, boxes=boxes)
+            elif detection == 'proxy':
+                start = time.perf_counter()
+                boxes = proxy_detect(gray if processed is None else processed)
+                row.update(ocr_ms=(time.perf_counter() - start) * 1000, boxes=boxes)
+            rows.append(row)
+
+        # 정답이 없는 실제 이미지는 기준 방식의 감지 결과를 정답으로 사용 (main에서 methods에 항상 포함)
+        if detection and truth is None:
+            truth = next(row['boxes'] for row in rows if row['method'] == reference)
+
+        for row in rows:
+            line = f"{name[:24]:<24} {sigma:>6.2f} {row['method']:<9} {row['prep_ms']:>9.1f}"
+            if detection:
+                line += (f" {row['ocr_ms']:>9.1f} {row['prep_ms'] + row['ocr_ms']:>9.1f}"
+                         f" {len(row['boxes']):>6} {recall(truth, row['boxes']):>7.2f}")
+            print(line)
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark OCR preprocessing latency vs detection recall')
+    parser.add_argument('images', nargs='*', help='Image paths (default: synthetic images)')
+    parser.add_argument('--methods', nargs='+', default=['off'] + list(DENOISE_METHODS),
+                        choices=['off'] + list(DENOISE_METHODS), help='Preprocessing methods to compare')
+    parser.add_argument('--repeat', type=int, default=3, help='Preprocessing repetitions per measurement')
+    detection = parser.add_mutually_exclusive_group()
+    detection.add_argument('--ocr', action='store_const', dest='detection', const='ocr',
+                           help='Also run OCR detection and report recall')
+    detection.add_argument('--proxy', action='store_const', dest='detection', const='proxy',
+                           help='Report recall of a model-free contour detector instead of OCR')
+    parser.add_argument('--reference', default='nlm', choices=['off'] + list(DENOISE_METHODS),
+                        help='Method whose detections serve as ground truth for real images')
+    parser.add_argument('--ocr-engine', default='easyocr', choices=['easyocr', 'paddleocr'], help='OCR engine choice')
+    parser.add_argument('--size', type=int, nargs=2, default=[2400, 1600], metavar=('WIDTH', 'HEIGHT'),
+                        help='Synthetic image size')
+    parser.add_argument('--noise', type=float, nargs='+', default=[0.0, 2.0, 3.0, 4.0, 6.0, 10.0, 20.0],
+                        help='Grayscale Gaussian noise sigmas for synthetic images')
+    parser.add_argument('--font-scale', type=float, nargs='+', default=[1.6, 0.5],
+                        help='Font scales for synthetic text (1.6 ~ 50px, 0.5 ~ 17px tall)')
+
+    args = parser.parse_args()
+
+    # 실제 이미지의 재현율 기준이 되는 방식은 항상 측정
+    methods = list(dict.fromkeys(args.methods))
+    if args.detection and args.images and args.reference not in methods:
+        methods.append(args.reference)
+
+    images = {}
+    temp_paths = []
+    if args.images:
+        for path in args.images:
+            image = cv2.imread(path)
+            if image is None:
+                print(f"Skipping unreadable image: {path}")
+                continue
+            images[os.path.basename(path)] = (path, image, None)
+    else:
+        width, height = args.size
+        for font_scale in args.font_scale:
+            for sigma in args.noise:
+                image, truth = make_synthetic_image(width, height, sigma, font_scale)
+                fd, path = tempfile.mkstemp(suffix='.png')
+                os.close(fd)
+                cv2.imwrite(path, image)
+                temp_paths.append(path)
+                images[f"synth_f{font_scale:g}_sigma{sigma:g}"] = (path, image, truth)
+
+    try:
+        run(images, methods, args.repeat, args.detection, args.reference, args.ocr_engine)
+    finally:
+        for path in temp_paths:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
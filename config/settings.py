@@ -18,6 +18,19 @@ OCR_SETTINGS = {
     'rec_batch_num': 6
 }
 
+# OCR 전처리 설정
+# denoise: 'none' | 'adaptive' | 'downscale' | 'fast' | 'median' | 'nlm'
+# adaptive는 추정 노이즈(그레이스케일 표준편차, 0~255)가 noise_threshold 미만이면 노이즈 제거를
+# 건너뛰고, 그 이상이면 downscale 방식을 사용 (benchmarks/preprocess_benchmark.py 결과 기준)
+PREPROCESS_SETTINGS = {
+    'enabled': False,
+    'denoise': 'adaptive',
+    'noise_threshold': 1.0,
+    'sharpen': True,
+    'clahe_clip_limit': 2.0,
+    'clahe_tile_grid': (8, 8)
+}
+
 # 번역 엔진 설정
 TRANSLATION_ENGINES = {
     'google': 'googletrans',
@@ -1,15 +1,20 @@
 import cv2
 import numpy as np
-from typing import List, Optional
+from typing import List, Optional, Union
 from paddleocr import PaddleOCR
 import easyocr
+from config.settings import PREPROCESS_SETTINGS
 from models.text_block import TextBlock, TextStyle
+from utils.image_utils import enhance_image_for_ocr
 
 
 class OCRDetector:
-    def __init__(self, use_angle_cls=True, lang='multilingual', engine='easyocr'):
+    def __init__(self, use_angle_cls=True, lang='multilingual', engine='easyocr',
+                 preprocess: Optional[dict] = None):
         self.lang = lang
         self.engine = engine
+        # 전처리 옵션: 기본 설정 위에 전달된 값만 덮어씀
+        self.preprocess_options = {**PREPROCESS_SETTINGS, **(preprocess or {})}
         
         if engine == 'easyocr' and lang == 'multilingual':
             # EasyOCR로 80개 언어 동시 지원
@@ -24,12 +29,20 @@ class OCRDetector:
             # 기본값: EasyOCR 다국어
             self.ocr = easyocr.Reader(['ko', 'en', 'ja', 'zh-cn', 'zh-tw'])
     
-    def detect_text(self, image_path: str, confidence_threshold: float = 0.5) -> List[TextBlock]:
+    def detect_text(self, image_path: str, confidence_threshold: float = 0.5,
+                    preprocess: Optional[bool] = None) -> List[TextBlock]:
         text_blocks = []
         
+        # 전처리 여부: 인자가 없으면 생성 시 설정을 따름
+        if preprocess is None:
+            preprocess = self.preprocess_options['enabled']
+        
+        # 전처리는 크기를 바꾸지 않으므로 bbox 좌표는 원본 기준 그대로 사용 가능
+        source: Union[str, np.ndarray] = self.preprocess_image(image_path) if preprocess else image_path
+        
         if self.engine == 'easyocr':
             # EasyOCR 결과 처리
-            results = self.ocr.readtext(image_path)
+            results = self.ocr.readtext(source)
             
             for result in results:
                 if len(result) < 3:
@@ -62,7 +75,7 @@ class OCRDetector:
                 
         else:
             # PaddleOCR 결과 처리
-            results = self.ocr.ocr(image_path, cls=True)
+            results = self.ocr.ocr(source, cls=True)
             
             if not results or not results[0]:
                 return text_blocks
@@ -99,13 +112,9 @@ class OCRDetector:
     
     def preprocess_image(self, image_path: str) -> np.ndarray:
         image = cv2.imread(image_path)
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
-        # 노이즈 제거
-        denoised = cv2.fastNlMeansDenoising(gray)
-        
-        # 대비 향상
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-        enhanced = clahe.apply(denoised)
+        if image is None:
+            raise ValueError(f"Could not read image: {image_path}")
         
-        return enhanced
\ No newline at end of file
+        # 노이즈 제거(적응형) + 대비 향상, 노이즈를 제거한 경우에만 샤프닝
+        options = {key: value for key, value in self.preprocess_options.items() if key != 'enabled'}
+        return enhance_image_for_ocr(image, **options)
@@ -6,6 +6,7 @@ from core.translator import TextTranslator
 from core.image_processor import ImageProcessor
 from core.style_analyzer import StyleAnalyzer
 from models.text_block import TextBlock
+from utils.image_utils import DENOISE_METHODS
 
 
 class ImageTranslator:
@@ -14,9 +15,10 @@ class ImageTranslator:
                  target_lang='ko',
                  translation_engine='google',
                  ocr_engine='easyocr',
-                 font_path: Optional[str] = None):
+                 font_path: Optional[str] = None,
+                 preprocess: Optional[dict] = None):
         
-        self.ocr_detector = OCRDetector(lang='multilingual', engine=ocr_engine)
+        self.ocr_detector = OCRDetector(lang='multilingual', engine=ocr_engine, preprocess=preprocess)
         self.translator = TextTranslator(source_lang, target_lang, translation_engine)
         self.image_processor = ImageProcessor(font_path)
         self.style_analyzer = StyleAnalyzer()
@@ -92,6 +94,8 @@ def main():
     parser.add_argument('--confidence', type=float, default=0.5, help='OCR confidence threshold')
     parser.add_argument('--font-path', help='Path to font file for rendering')
     parser.add_argument('--ocr-engine', default='easyocr', choices=['easyocr', 'paddleocr'], help='OCR engine choice')
+    parser.add_argument('--preprocess', nargs='?', const='adaptive', choices=DENOISE_METHODS,
+                        help='Preprocess image before OCR with the given denoise method (default: adaptive)')
     parser.add_argument('--preview', action='store_true', help='Preview detected text without translation')
     
     args = parser.parse_args()
@@ -100,7 +104,8 @@ def main():
         source_lang=args.source_lang,
         target_lang=args.target_lang,
         ocr_engine=args.ocr_engine,
-        font_path=args.font_path
+        font_path=args.font_path,
+        preprocess={'enabled': True, 'denoise': args.preprocess} if args.preprocess else None
     )
     
     if args.preview: